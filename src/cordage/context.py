@@ -2,8 +2,10 @@ import argparse
 import dataclasses
 import inspect
 import sys
-from collections.abc import Mapping
+import weakref
+from collections.abc import Generator
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
@@ -16,14 +18,22 @@ from typing import (
     get_origin,
 )
 
-from docstring_parser import parse as parse_docstring
-
 from cordage.experiment import Experiment, Series, Status, Trial
 from cordage.global_config import GlobalConfig
-from cordage.util import ConfigClass, logger, nest_items, nested_update, read_dict_from_file
+from cordage.util import (
+    ConfigClass,
+    dataclass_fields,
+    logger,
+    nest_items,
+    read_dict_from_file,
+)
 
 
 class MissingType:
+    """Type of the `MISSING` sentinel (for values not set via CLI)."""
+
+    __slots__ = ()
+
     def __repr__(self):
         return "<MISSING>"
 
@@ -33,53 +43,236 @@ MISSING = MissingType()
 
 SUPPORTED_PRIMITIVES = (int, bool, str, float, Path)
 
+_NoneType = type(None)
+
+
+@lru_cache(maxsize=256)
+def _get_param_doc(config_cls: type) -> dict[str, Optional[str]]:
+    """Read the parameter descriptions from a config class docstring.
+
+    The result is cached per class, as parsing docstrings is relatively
+    expensive.
+    """
+    if config_cls.__doc__ is None:
+        return {}
+
+    # docstring_parser is only imported when a docstring needs parsing
+    from docstring_parser import parse as parse_docstring
+
+    return {
+        param.arg_name: param.description for param in parse_docstring(config_cls.__doc__).params
+    }
+
+
+@lru_cache(maxsize=256)
+def _get_help_texts(config_cls: type) -> dict[str, str]:
+    """Determine the help texts of all fields in a config class.
+
+    If a field has no help metadata, the description in the docstring of
+    the class is used. The result is cached per class.
+    """
+    fields = dataclass_fields(config_cls)
+
+    if all("help" in field.metadata for field in fields):
+        # no need to parse the docstring
+        return {field.name: field.metadata["help"] for field in fields}
+
+    param_doc = _get_param_doc(config_cls)
+
+    return {
+        field.name: field.metadata.get("help", param_doc.get(field.name) or "") for field in fields
+    }
+
+
+# Positional arguments (option strings) and keyword arguments of an
+# `add_argument` call
+ArgumentSpec = tuple[tuple[str, ...], dict[str, Any]]
+
+
+def _iter_argument_specs(
+    arg_name: str,
+    arg_type: Any,
+    help: str,  # noqa: A002
+) -> Generator[ArgumentSpec, None, None]:
+    # If the field is also a dataclass, recurse (nested config)
+    if dataclasses.is_dataclass(arg_type):
+        assert isinstance(arg_type, type)
+        yield (
+            (f"--{arg_name}",),
+            {"type": Path, "default": MISSING, "help": help, "metavar": "PATH"},
+        )
+        yield from _iter_config_argument_specs(arg_type, prefix=arg_name)
+
+    # Look the fields annotation to determine which type of argument
+    # to add
+
+    # Choice field
+    elif get_origin(arg_type) is Literal:
+        # Value must be from this set
+        choices = get_args(arg_type)
+
+        literal_types = set(map(type, choices))
+
+        if len(literal_types) != 1:
+            msg = f"If Literal is used, all values must be of the same type ({arg_name})."
+            raise TypeError(msg)
+
+        (literal_arg_type,) = literal_types
+
+        yield (
+            (f"--{arg_name}",),
+            {"type": literal_arg_type, "choices": choices, "default": MISSING, "help": help},
+        )
+
+    elif get_origin(arg_type) is Union:
+        args = [arg for arg in get_args(arg_type) if arg is not _NoneType]
+
+        if len(args) == 1:
+            # optional
+            yield from _iter_argument_specs(arg_name, args[0], help=help)
+
+        else:
+            msg = (
+                f"Parameter `{arg_name}` could not be processed:"
+                "Config parser does not support Union annotations with more than one type "
+                "other than None."
+            )
+            raise TypeError(msg)
+
+    # Boolean field
+    elif arg_type is bool:
+        # Create a true/false flag -> the destination is identical
+        yield (
+            (f"--{arg_name}",),
+            {
+                "action": "store_true",
+                "default": MISSING,
+                "help": help + " (set the value to True)",
+            },
+        )
+
+        yield (
+            (f"--not-{arg_name}",),
+            {
+                "dest": arg_name,
+                "action": "store_false",
+                "default": MISSING,
+                "help": help + " (set the value to False)",
+            },
+        )
+
+    elif arg_type in SUPPORTED_PRIMITIVES:
+        yield (f"--{arg_name}",), {"type": arg_type, "default": MISSING, "help": help}
+
+
+def _iter_config_argument_specs(
+    config_cls: type, prefix: Optional[str] = None, skip_field: Optional[str] = None
+) -> Generator[ArgumentSpec, None, None]:
+    help_texts = _get_help_texts(config_cls)
+
+    name_prefix = "" if prefix is None else prefix + "."
+
+    # Iterate over all fields in the dataclass
+    for field in dataclass_fields(config_cls):
+        if not field.init or field.name == skip_field:
+            continue
+
+        yield from _iter_argument_specs(
+            name_prefix + field.name, field.type, help=help_texts[field.name]
+        )
+
+
+@lru_cache(maxsize=256)
+def _get_config_argument_specs(
+    config_cls: type, prefix: Optional[str] = None, skip_field: Optional[str] = None
+) -> tuple[ArgumentSpec, ...]:
+    """Derive the parser arguments for all fields of a config class.
+
+    Nested config classes are handled recursively. The result only
+    depends on the config class, hence it is cached.
+
+    Args:
+        config_cls: Dataclass to derive the arguments for.
+        prefix: Prefix of the argument names (for nested configs).
+        skip_field: Name of a field for which no argument is created.
+    """
+    return tuple(_iter_config_argument_specs(config_cls, prefix, skip_field))
+
 
-class Singleton(type):
-    _instances: ClassVar[dict[type, Any]] = {}
+_signature_cache: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_signature(func: Callable) -> inspect.Signature:
+    """Return the signature of a callable (cached per callable).
+
+    Entries are dropped once the callable is garbage collected.
+    """
+    try:
+        return _signature_cache[func]
+    except KeyError:
+        signature = _signature_cache[func] = inspect.signature(func)
+        return signature
+    except TypeError:
+        # callable can not be weakly referenced or is not hashable
+        return inspect.signature(func)
+
+
+def _get_trial_config(trial: Trial) -> Any:
+    return trial.config
+
+
+def _get_trial_output_dir(trial: Trial) -> Path:
+    return trial.output_dir
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
 
+def _get_trial_output_dir_str(trial: Trial) -> str:
+    return str(trial.output_dir)
 
-class ExperimentStack(metaclass=Singleton):
+
+def _get_trial(trial: Trial) -> Trial:
+    return trial
+
+
+class ExperimentStack:
     """Represents the stack of currently running experiments.
 
     This class is used internally, to determine whether an experiment
-    was started from within another.
+    was started from within another. A single instance
+    (`experiment_stack`) is created when the module is imported.
     """
 
     def __init__(self):
         self.running: list[Experiment] = []
 
+        # currently running experiment (top of the stack)
+        self._top: Optional[Experiment] = None
+
     def push(self, experiment: Experiment):
         """Push a new experiment on the stack."""
         self.running.append(experiment)
+        self._top = experiment
 
     def pop(self) -> Experiment:
         """Pop the currently running experiment from the stack."""
-        return self.running.pop()
+        experiment = self.running.pop()
+        self._top = self.running[-1] if self.running else None
+        return experiment
 
     def peek(self) -> Optional[Experiment]:
         """Get the currently active experiment from the stack.
 
         If the stack is empty, None is returned.
         """
-        if len(self.running) > 0:
-            return self.running[-1]
-        else:
-            return None
+        return self._top
 
     def peek_dir(self) -> Optional[Path]:
         """Get the output_dir of the currently running experiment.
 
         If the stack is empty, None is returned.
         """
-        if len(self.running) > 0:
-            return self.running[-1].output_dir
-        else:
-            return None
+        return None if self._top is None else self._top.output_dir
 
     def __len__(self):
         return len(self.running)
@@ -119,6 +312,12 @@ class FunctionContext:
 
     usage_str: str = "%(prog)s [-h] [config_file] <configuration options to overwrite>"
 
+    # Argument parsers only depend on the configuration class, the
+    # description and a few global config values: they can be reused
+    # across contexts (see `construct_argument_parser`). Entries are
+    # kept until `clear_parser_cache` is called.
+    _parser_cache: ClassVar[dict[tuple, tuple[argparse.ArgumentParser, Any]]] = {}
+
     def __init__(
         self,
         func: Callable,  # expects a dataclass
@@ -130,11 +329,15 @@ class FunctionContext:
         self.set_function(func)
         self.set_config_cls(config_cls)
         self.set_description(description)
-        self.construct_argument_parser()
+
+        # the argument parser is only constructed once it is needed
+        self._argument_parser: Optional[argparse.ArgumentParser] = None
 
     def set_description(self, description: Optional[str] = None):
         if description is None:
             if self.func.__doc__ is not None:
+                from docstring_parser import parse as parse_docstring
+
                 self.description = parse_docstring(self.func.__doc__).short_description
             else:
                 self.description = self.func_name
@@ -174,7 +377,7 @@ class FunctionContext:
 
     def set_function(self, func: Callable):
         self._func = func
-        self._func_parameters = inspect.signature(func).parameters
+        self._func_parameters = _get_signature(func).parameters
         self._func_name = self.func.__name__
 
         if self.global_config.param_name_config not in self.func_parameters:
@@ -184,15 +387,90 @@ class FunctionContext:
             )
             raise TypeError(msg)
 
-    def construct_argument_parser(self):
-        """Construct an argparser for a given config class."""
+        self._func_kwargs_plan = self._plan_func_kwargs()
+
+    def _plan_func_kwargs(self) -> list[tuple[str, Callable[[Trial], Any]]]:
+        """Determine which arguments need to be passed to the function.
+
+        Returns:
+            A list of (parameter name, getter) tuples. Each getter
+            retrieves the value to pass from a trial.
+        """
+        plan: list[tuple[str, Callable[[Trial], Any]]] = []
+
+        config_only = self.global_config.config_only
+        param_name_config = self.global_config.param_name_config
+        param_name_output_dir = self.global_config.param_name_output_dir
+        param_name_trial_object = self.global_config.param_name_trial_object
+
+        # check if any other parameters are expected which can be
+        # resolved
+        for name, param in self.func_parameters.items():
+            if param.kind == param.POSITIONAL_ONLY:
+                msg = "Cordage currently does not support positional only parameters."
+                raise TypeError(msg)
+
+            if name == param_name_config:
+                # pass the configuration
+                plan.append((name, _get_trial_config))
+
+            elif config_only:
+                continue
+
+            elif name == param_name_output_dir:
+                # pass path to output directory
+                annotation = param.annotation
+                if isinstance(annotation, type) and issubclass(annotation, str):
+                    plan.append((name, _get_trial_output_dir_str))
+                else:
+                    plan.append((name, _get_trial_output_dir))
+
+            elif name == param_name_trial_object:
+                # pass trial object
+                plan.append((name, _get_trial))
+
+        return plan
+
+    @classmethod
+    def clear_parser_cache(cls):
+        """Remove all cached argument parsers."""
+        cls._parser_cache.clear()
+
+    def _parser_cache_key(self) -> tuple:
+        return (
+            type(self),
+            self.main_config_cls,
+            self.description,
+            self.usage_str,
+            self.global_config.config_only,
+            self.global_config.param_name_output_dir,
+        )
+
+    @property
+    def argument_parser(self) -> argparse.ArgumentParser:
+        if self._argument_parser is None:
+            return self.construct_argument_parser()
+        return self._argument_parser
+
+    def construct_argument_parser(self) -> argparse.ArgumentParser:
+        """Construct an argparser for a given config class.
+
+        Parsers are cached: contexts which would produce identical
+        parsers share the same instance.
+        """
+        key = self._parser_cache_key()
+
+        if key in self._parser_cache:
+            self._argument_parser, self.arg_group_config = self._parser_cache[key]
+            return self._argument_parser
+
         # add parser arguments from dataclass
 
-        self.argument_parser = argparse.ArgumentParser(
+        argument_parser = argparse.ArgumentParser(
             description=self.description, usage=self.usage_str
         )
 
-        self.argument_parser.add_argument(
+        argument_parser.add_argument(
             ".",
             metavar="config_file",
             nargs="?",
@@ -201,7 +479,7 @@ class FunctionContext:
             default=MISSING,
         )
 
-        self.argument_parser.add_argument(
+        argument_parser.add_argument(
             "--series-skip",
             type=int,
             metavar="N",
@@ -211,7 +489,7 @@ class FunctionContext:
         )
 
         if not self.global_config.config_only:
-            self.argument_parser.add_argument(
+            argument_parser.add_argument(
                 "--cordage-comment",
                 type=str,
                 help="Add a comment to the annotation of this series.",
@@ -220,7 +498,7 @@ class FunctionContext:
                 metavar="COMMENT",
             )
 
-            self.argument_parser.add_argument(
+            argument_parser.add_argument(
                 "--output_dir",
                 type=Path,
                 help="Path to use as the output directory.",
@@ -229,147 +507,44 @@ class FunctionContext:
                 metavar="PATH",
             )
 
-        self.arg_group_config = self.argument_parser.add_argument_group("configuration")
+        self.arg_group_config = argument_parser.add_argument_group("configuration")
         self.add_arguments_to_parser(self.main_config_cls)
 
-    def _add_argument_to_parser(self, arg_name: str, arg_type: Any, help: str, **kw):  # noqa: A002
-        # If the field is also a dataclass, recurse (nested config)
-        if dataclasses.is_dataclass(arg_type):
-            assert isinstance(arg_type, type)
-            self.arg_group_config.add_argument(
-                f"--{arg_name}", type=Path, default=MISSING, help=help, metavar="PATH", **kw
-            )
-            self.add_arguments_to_parser(arg_type, prefix=arg_name)
-
-        # Look the fields annotation to determine which type of argument
-        # to add
-
-        # Choice field
-        elif get_origin(arg_type) is Literal:
-            # Value must be from this set
-            choices = get_args(arg_type)
-
-            literal_arg_type = type(choices[0])
+        self._argument_parser = argument_parser
+        self._parser_cache[key] = (argument_parser, self.arg_group_config)
 
-            if any(not isinstance(c, literal_arg_type) for c in choices):
-                msg = f"If Literal is used, all values must be of the same type ({arg_name})."
-                raise TypeError(msg)
-
-            self.arg_group_config.add_argument(
-                f"--{arg_name}",
-                type=literal_arg_type,
-                choices=choices,
-                default=MISSING,
-                help=help,
-                **kw,
-            )
-
-        elif get_origin(arg_type) is Union:
-            args = [arg for arg in get_args(arg_type) if arg is not type(None)]
-
-            if len(args) == 1:
-                # optional
-                self._add_argument_to_parser(arg_name, args[0], help=help, **kw)
-
-            else:
-                msg = (
-                    f"Parameter `{arg_name}` could not be processed:"
-                    "Config parser does not support Union annotations with more than one type "
-                    "other than None."
-                )
-                raise TypeError(msg)
-
-        # Boolean field
-        elif arg_type is bool:
-            # Create a true/false flag -> the destination is identical
-            self.arg_group_config.add_argument(
-                f"--{arg_name}",
-                action="store_true",
-                default=MISSING,
-                help=help + " (set the value to True)",
-                **kw,
-            )
-
-            self.arg_group_config.add_argument(
-                f"--not-{arg_name}",
-                dest=arg_name,
-                action="store_false",
-                default=MISSING,
-                help=help + " (set the value to False)",
-                **kw,
-            )
-
-        elif arg_type in SUPPORTED_PRIMITIVES:
-            self.arg_group_config.add_argument(
-                f"--{arg_name}", type=arg_type, default=MISSING, help=help, **kw
-            )
+        return argument_parser
 
     def add_arguments_to_parser(self, config_cls: type, prefix: Optional[str] = None):
         """Add all fields in the (nested) config class to the parser.
 
-        Recursively iterate over the fields adding arguments to the
-        parser.
+        The arguments are derived once per config class (see
+        `_get_config_argument_specs`).
         """
+        skip_field = self.global_config.param_name_output_dir if prefix is None else None
 
-        # read documentation of config dataclass. If no help metadata is
-        # given, this will be used a the help text.
-        param_doc = {}
-        if config_cls.__doc__ is not None:
-            # parse doc text, to generate help text for fields
-            for param in parse_docstring(config_cls.__doc__).params:
-                param_doc[param.arg_name] = param.description
-
-        # Iterate over all fields in the dataclass to add arguments to
-        # the parser
-        for field in dataclasses.fields(config_cls):
-            if not field.init:
-                continue
-
-            if prefix is None and field.name == self.global_config.param_name_output_dir:
-                continue
-
-            # Set prefixed argument name
-            if prefix is not None:
-                arg_name = f"{prefix}.{field.name}"
-            else:
-                arg_name = field.name
+        for option_strings, kw in _get_config_argument_specs(config_cls, prefix, skip_field):
+            self.arg_group_config.add_argument(*option_strings, **kw)
 
-            # Retrieve help text
-            help_text = field.metadata.get("help", param_doc.get(field.name, ""))
+    def check_config_cls(self):
+        """Check that parser arguments can be derived for all fields.
 
-            self._add_argument_to_parser(arg_name, field.type, help=help_text)
+        Raises:
+            TypeError: If a field of the config class has an
+              unsupported annotation.
+        """
+        skip_field = self.global_config.param_name_output_dir
+        _get_config_argument_specs(self.main_config_cls, None, skip_field)
 
-    def remove_missing_values(self, data: Mapping) -> dict[str, Any]:
-        return {k: v for k, v in data.items() if v is not MISSING}
+    def remove_missing_values(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Remove all missing values from the dict (in place)."""
+        for k in [k for k, v in data.items() if v is MISSING]:
+            del data[k]
+        return data
 
     def construct_func_kwargs(self, trial: Trial):
         # construct arguments for the passed callable
-        func_kw: dict[str, Any] = {}
-
-        # check if any other parameters are expected which can be
-        # resolved
-        for name, param in self.func_parameters.items():
-            assert (
-                param.kind != param.POSITIONAL_ONLY
-            ), "Cordage currently does not support positional only parameters."
-
-            if name == self.global_config.param_name_config:
-                # pass the configuration
-                func_kw[name] = trial.config
-
-            elif not self.global_config.config_only:
-                if name == self.global_config.param_name_output_dir:
-                    # pass path to output directory
-                    if issubclass(param.annotation, str):
-                        func_kw[name] = str(trial.output_dir)
-                    else:
-                        func_kw[name] = trial.output_dir
-
-                elif name == self.global_config.param_name_trial_object:
-                    # pass trial object
-                    func_kw[name] = trial
-
-        return func_kw
+        return {name: get_value(trial) for name, get_value in self._func_kwargs_plan}
 
     def parse_args(self, args: Optional[list[str]] = None) -> Experiment:
         """Parse the command line arguments.
@@ -391,9 +566,16 @@ class FunctionContext:
         else:
             args = list(args)
 
-        # construct parser
-        argument_data: dict = vars(self.argument_parser.parse_args(args))
-        argument_data = self.remove_missing_values(argument_data)
+        argument_data: dict
+        if len(args) > 0:
+            argument_data = vars(self.argument_parser.parse_args(args))
+            argument_data = self.remove_missing_values(argument_data)
+        else:
+            # without any arguments, the parser would only yield missing
+            # values: the defaults of the config class are used (the
+            # config class is still checked for unsupported fields)
+            self.check_config_cls()
+            argument_data = {}
 
         conf_file_comment: Optional[str] = None
         cli_series_comment: Optional[str] = None
@@ -413,18 +595,13 @@ class FunctionContext:
 
         config_path = argument_data.pop(".", None)
 
-        argument_data = nest_items(argument_data.items())
-
         if config_path is not None:
-            new_conf_data = read_dict_from_file(config_path)
-
-            new_conf_data = nest_items(new_conf_data.items())
+            conf_data = nest_items(read_dict_from_file(config_path).items())
 
-            series_kw["series_spec"] = new_conf_data.pop(self.global_config._series_spec_key, None)
+            series_kw["series_spec"] = conf_data.pop(self.global_config._series_spec_key, None)
 
-            nested_update(new_conf_data, argument_data)
-
-            argument_data = new_conf_data
+            # values given via the CLI take precedence over the file
+            argument_data = nest_items(argument_data.items(), into=conf_data)
 
             if not self.global_config.config_only:
                 # another series comment might be given via the confi
@@ -434,6 +611,7 @@ class FunctionContext:
                     self.global_config._experiment_comment_key, None
                 )
         else:
+            argument_data = nest_items(argument_data.items())
             series_kw["series_spec"] = None
 
         # series skip might be given via the command line
@@ -502,27 +680,32 @@ class FunctionContext:
         configuration given by the experiment.
         """
         if isinstance(experiment, Trial):
-            if self.global_config.config_only:
-                # execute function with the constructed keyword
-                # arguments
-                func_kw = self.construct_func_kwargs(experiment)
-                experiment.metadata.result = self.func(**func_kw)
-
-            else:
-                # only use stack if full feature-set is used
-                with experiment_stack.with_experiment_on_stack(experiment):
-                    func_kw = self.construct_func_kwargs(experiment)
-                    experiment.metadata.result = self.func(**func_kw)
+            self._execute_trial(experiment)
 
         elif isinstance(experiment, Series):
-            if self.global_config.config_only:
-                for trial in experiment:
-                    self.execute(trial)
-            else:
-                with experiment_stack.with_experiment_on_stack(experiment):
-                    for trial in experiment:
-                        self.execute(trial)
+            self._execute_series(experiment)
 
         else:
             msg = "Passed object must be Trial or Series"
             raise TypeError(msg)
+
+    def _execute_trial(self, trial: Trial):
+        if self.global_config.config_only:
+            # execute function with the constructed keyword arguments
+            func_kw = self.construct_func_kwargs(trial)
+            trial.metadata.result = self.func(**func_kw)
+
+        else:
+            # only use stack if full feature-set is used
+            with experiment_stack.with_experiment_on_stack(trial):
+                func_kw = self.construct_func_kwargs(trial)
+                trial.metadata.result = self.func(**func_kw)
+
+    def _execute_series(self, series: Series):
+        if self.global_config.config_only:
+            for trial in series:
+                self._execute_trial(trial)
+        else:
+            with experiment_stack.with_experiment_on_stack(series):
+                for trial in series:
+                    self._execute_trial(trial)
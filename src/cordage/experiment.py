@@ -1,13 +1,20 @@
 import logging
 import shutil
+from collections import deque
 from collections.abc import Generator
 from copy import deepcopy
 from datetime import datetime, timezone
+from functools import lru_cache
 from itertools import count, product
+from json import dumps as json_dumps
 from json.decoder import JSONDecodeError
-from math import ceil, floor, log10
-from os import PathLike, getpid
+from math import ceil, isfinite, log10, prod
+from os import PathLike, fspath, getpid, listdir, makedirs, walk
+from os.path import join as join_path
+from os.path import normcase
+from os.path import split as split_path
 from pathlib import Path
+from string import Formatter
 from traceback import format_exception
 from typing import (
     Any,
@@ -33,6 +40,7 @@ from cordage.util import (
     config_output_dir_type,
     flattened_items,
     from_dict,
+    json_loads,
     logger,
     nest_items,
     nested_update,
@@ -45,6 +53,93 @@ if typing.TYPE_CHECKING:
 ConfigClass = TypeVar("ConfigClass", bound="DataclassInstance")
 
 
+def _nest_dotted_keys(data: dict[str, Any]) -> dict[str, Any]:
+    """Move values of dotted keys (e.g. "a.b") into nested dicts.
+
+    Empty sub-dicts are dropped. Dicts without any dotted keys or empty
+    sub-dicts are returned as they are.
+    """
+    stack = [data]
+    while stack:
+        sub_dict = stack.pop()
+        if any("." in k or (isinstance(v, dict) and not v) for k, v in sub_dict.items()):
+            break
+        stack.extend(v for v in sub_dict.values() if isinstance(v, dict))
+    else:
+        return data
+
+    return nest_items(
+        (tuple(part for k in key for part in k.split(".")), value)
+        for key, value in flattened_items(data)
+    )
+
+
+def _is_plain_json(data: Any) -> bool:
+    """Check whether data survives a JSON round trip unchanged.
+
+    Only the exact builtin types are accepted (no subclasses such as
+    str-Enums, no tuples or non-string keys), floats need to be finite
+    and integers need to fit into 64 bit.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+
+        if value_type is dict:
+            if any(type(k) is not str for k in value):
+                return False
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+        elif value_type is float:
+            if not isfinite(value):
+                return False
+        elif value_type is int:
+            if not -(2**63) <= value < 2**64:
+                return False
+        elif value_type not in (str, bool, type(None)):
+            return False
+
+    return True
+
+
+# formatters are shared by the log handlers of all experiments
+_log_format = "%(name)s:%(filename)s:%(lineno)d - %(message)s"
+
+_stream_formatter: logging.Formatter
+if colorlog is not None:
+    _stream_formatter = colorlog.ColoredFormatter(
+        f"%(log_color)s%(levelname)-8s%(reset)s {_log_format}"
+    )
+else:
+    _stream_formatter = logging.Formatter(f"%(levelname)-8s {_log_format}")
+
+_file_formatter = logging.Formatter(f"%(asctime)s %(levelname)-8s {_log_format}")
+
+# stands in for the collision suffix in pre-rendered output dir formats
+# (cannot occur in paths)
+_SUFFIX_PLACEHOLDER = "\0"
+
+
+@lru_cache(maxsize=16)
+def _collision_suffix_usage(output_dir_format: str) -> tuple[bool, bool]:
+    """Determine how the collision suffix is used in a format string.
+
+    Returns:
+        Whether the suffix is used at all, and whether it is only used
+        as is (without format spec or conversion). In the latter case,
+        it can be substituted after formatting.
+    """
+    fields = [
+        (spec, conversion)
+        for _, name, spec, conversion in Formatter().parse(output_dir_format)
+        if name == "collision_suffix"
+    ]
+
+    return len(fields) > 0, all(not spec and conversion is None for spec, conversion in fields)
+
+
 class Experiment(Annotatable):
     def __init__(self, *args, config_cls: Optional[type] = None, **kwargs):
         super().__init__(*args, **kwargs)
@@ -141,6 +236,7 @@ class Experiment(Annotatable):
                 )
 
             self.metadata = metadata
+            self._last_written_metadata = None
 
             self.load_annotations()
         else:
@@ -186,13 +282,20 @@ class Experiment(Annotatable):
         seen_dirs: set[Path] = set()
         experiments = []
 
-        for p in results_path.rglob("*/cordage.json"):
-            if skip_hidden and any(
-                part.startswith(".") for part in (p.relative_to(results_path)).parts
-            ):
-                continue
+        # follow symlinked directories (as rglob did)
+        for dirpath, dirnames, filenames in walk(results_path, followlinks=True):
+            if skip_hidden:
+                # do not descend into hidden directories
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+
+            # visiting the directories in order yields the experiments
+            # sorted by their output dir
+            dirnames.sort(key=normcase)
+
+            path = Path(dirpath)
 
-            path = p.parent
+            if path == results_path or "cordage.json" not in filenames:
+                continue
 
             if path.parent in seen_dirs:
                 # we already encountered a parent experiment (series)
@@ -201,11 +304,11 @@ class Experiment(Annotatable):
             seen_dirs.add(path)
 
             try:
-                experiments.append(cls.from_path(p.parent))
+                experiments.append(cls.from_path(path))
             except (JSONDecodeError, DaciteError) as exc:
                 logger.warning("Couldn't load '%s': %s", str(path), str(exc))
 
-        return sorted(experiments, key=lambda exp: exp.output_dir)
+        return experiments
 
     def setup_log(self):
         logger = logging.getLogger()
@@ -220,29 +323,20 @@ class Experiment(Annotatable):
 
         if self.global_config.logging_to_stream and is_toplevel:
             # add colored stream handler
-            format_str = "%(name)s:%(filename)s:%(lineno)d - %(message)s"
-
             if colorlog is not None:
                 handler = colorlog.StreamHandler()
-                handler.setFormatter(
-                    colorlog.ColoredFormatter(
-                        f"%(log_color)s%(levelname)-8s%(reset)s {format_str}"
-                    )
-                )
             else:
                 handler = logging.StreamHandler()
-                handler.setFormatter(logging.Formatter(f"%(levelname)-8s {format_str}"))
+
+            handler.setFormatter(_stream_formatter)
 
             logger.addHandler(handler)
             self.log_handlers.append(handler)
 
         if self.global_config.logging_to_file:
             # setup logging to local output_dir
-            formatter = logging.Formatter(
-                "%(asctime)s %(levelname)-8s %(name)s:%(filename)s:%(lineno)d - %(message)s"
-            )
             handler = logging.FileHandler(self.log_path)
-            handler.setFormatter(formatter)
+            handler.setFormatter(_file_formatter)
 
             logger.addHandler(handler)
             self.log_handlers.append(handler)
@@ -260,21 +354,48 @@ class Experiment(Annotatable):
             self.set_output_dir(self.output_dir)
             return self.output_dir
 
-        tried_paths: set[Path] = set()
+        # candidates are handled as strings: a path object is only
+        # created for the final output dir
+        base_output_dir = fspath(self.global_config.base_output_dir)
+        output_dir_format = self.global_config.output_dir_format
+
+        # only the collision suffix changes between candidates
+        format_kw = dict(self.metadata.__dict__)
+
+        # without a collision suffix, all candidates are the same (the
+        # first collision is final)
+        uses_suffix, plain_suffix = _collision_suffix_usage(output_dir_format)
+
+        template: Optional[str] = None
+        if plain_suffix:
+            # format once, then only substitute the suffix per candidate
+            format_kw["collision_suffix"] = _SUFFIX_PLACEHOLDER
+            template = output_dir_format.format_map(format_kw)
+
+        tried_paths: set[str] = set()
         suffix = ""
 
+        # contents of the directory of the first colliding candidate
+        snapshot_dir: Optional[str] = None
+        existing_names: frozenset[str] = frozenset()
+
+        # each level of the suffix adds an underscore and two digits
+        level = 1
+        next_level_at = 100
+
         for i in count(1):
             if i > 1:
-                level = floor(log10(i) / 2) + 1
+                if i >= next_level_at:
+                    level += 1
+                    next_level_at *= 100
+
                 suffix = "_" * level + str(i).zfill(2 * level)
 
-            path = (
-                self.global_config.base_output_dir
-                / self.global_config.output_dir_format.format(
-                    **self.metadata.__dict__,
-                    collision_suffix=suffix,
-                )
-            )
+            if template is not None:
+                path = join_path(base_output_dir, template.replace(_SUFFIX_PLACEHOLDER, suffix))
+            else:
+                format_kw["collision_suffix"] = suffix
+                path = join_path(base_output_dir, output_dir_format.format_map(format_kw))
 
             if path in tried_paths:
                 # suffix was already tried: assume that further tries
@@ -282,22 +403,36 @@ class Experiment(Annotatable):
                 msg = f"Path {path} does already exist - collision could not be avoided."
                 raise RuntimeError(msg)
 
+            parent, name = split_path(path)
+
+            if parent == snapshot_dir and name in existing_names:
+                # known collision: no need to attempt creating it
+                tried_paths.add(path)
+                continue
+
             try:
-                path.mkdir(parents=True, exist_ok=False)
-                self.set_output_dir(path)
-                return path
+                makedirs(path, exist_ok=False)
             except FileExistsError:
                 if self.global_config.overwrite_existing:
                     logger.warning(
-                        "Path %s does existing. Replacing directory with new one.", str(path)
+                        "Path %s does existing. Replacing directory with new one.", path
                     )
                     shutil.rmtree(path)
-                    path.mkdir(parents=True)
-                    self.set_output_dir(path)
-                    return path
+                    makedirs(path)
                 else:
                     tried_paths.add(path)
 
+                    if snapshot_dir is None and uses_suffix:
+                        # list the directory once to skip over further
+                        # existing candidates
+                        snapshot_dir = parent
+                        existing_names = frozenset(listdir(parent or "."))
+
+                    continue
+
+            self.set_output_dir(Path(path))
+            return self.output_dir
+
 
 class Trial(Experiment, Generic[ConfigClass]):
     def __init__(
@@ -376,10 +511,7 @@ class Series(Generic[ConfigClass], Experiment):
             super().__init__(metadata, config_cls=config_cls)
         else:
             if isinstance(series_spec, list):
-                series_spec = [
-                    nest_items(flattened_items(trial_update, sep="."))
-                    for trial_update in series_spec
-                ]
+                series_spec = [_nest_dotted_keys(trial_update) for trial_update in series_spec]
 
             super().__init__(
                 configuration={
@@ -391,6 +523,9 @@ class Series(Generic[ConfigClass], Experiment):
                 **kw,
             )
 
+        self._len_cache: Optional[tuple[Any, int]] = None
+        self._grid_axes_cache: Optional[tuple[Any, tuple[list, list]]] = None
+
         self.validate_series_spec()
         self.make_all_trials()
 
@@ -404,13 +539,16 @@ class Series(Generic[ConfigClass], Experiment):
         elif isinstance(series_spec, dict):
 
             def only_list_nodes(d):
-                for v in d.values():
-                    if isinstance(v, dict):
-                        if not only_list_nodes(v):
+                nodes = deque([d])
+
+                while len(nodes) > 0:
+                    for v in nodes.popleft().values():
+                        if isinstance(v, dict):
+                            nodes.append(v)
+                        elif not isinstance(v, list):
                             return False
-                    elif not isinstance(v, list):
-                        return False
-                    return True
+
+                return True
 
             assert only_list_nodes(series_spec), f"Invalid series specification: {series_spec}"
         else:
@@ -479,29 +617,59 @@ class Series(Generic[ConfigClass], Experiment):
         if isinstance(self.series_spec, list):
             yield from self.series_spec
         elif isinstance(self.series_spec, dict):
-            keys, values = zip(*flattened_items(self.series_spec, sep="."))
+            keys, values = self._get_grid_axes(self.series_spec)
 
             for update_values in product(*values):
                 yield nest_items(zip(keys, update_values))
         else:
             yield {}
 
+    def _get_grid_axes(
+        self, series_spec: dict[str, Any]
+    ) -> tuple[list[tuple[str, ...]], list[list]]:
+        """Determine the keys and values of a grid (dict) series spec.
+
+        Dotted keys are split into their parts, so they do not need to
+        be split for each trial. The result is cached as long as the
+        series spec is the same object.
+        """
+        if self._grid_axes_cache is None or self._grid_axes_cache[0] is not series_spec:
+            flat_items = list(flattened_items(series_spec))
+
+            keys = [tuple(part for k in key for part in k.split(".")) for key, _ in flat_items]
+            values = [v for _, v in flat_items]
+
+            self._grid_axes_cache = (series_spec, (keys, values))
+
+        return self._grid_axes_cache[1]
+
     def _derive_len(self) -> int:
-        if isinstance(self.series_spec, list):
-            return len(self.series_spec)
-        elif isinstance(self.series_spec, dict):
-            num_trials = 1
-            for _, values in flattened_items(self.series_spec):
-                num_trials *= len(values)
-            return num_trials
+        series_spec = self.series_spec
+
+        # the length is cached as long as the series spec is the same
+        # object (it is replaced if, e.g., the metadata is reloaded)
+        if self._len_cache is not None and self._len_cache[0] is series_spec:
+            return self._len_cache[1]
+
+        num_trials: int
+        if isinstance(series_spec, list):
+            num_trials = len(series_spec)
+        elif isinstance(series_spec, dict):
+            _, grid_values = self._get_grid_axes(series_spec)
+            num_trials = prod(len(values) for values in grid_values)
         else:
-            return 1
+            num_trials = 1
+
+        self._len_cache = (series_spec, num_trials)
+        return num_trials
 
     def __len__(self) -> int:
-        if len(self.trials) != self._derive_len():
+        expected_len = self._derive_len()
+
+        if len(self.trials) != expected_len:
             msg = (
                 f"Number of existing ({len(self.trials)}) and expected trials "
-                f"({self._derive_len()}) do not match."
+                f"({expected_len}) do not match."
             )
             raise RuntimeError(msg)
 
@@ -546,8 +714,18 @@ class Series(Generic[ConfigClass], Experiment):
             )
             self.trials = []
 
+            # copying the base config via JSON is faster than deepcopy
+            # (if the config survives the round trip unchanged)
+            base_config_json: Optional[str] = None
+            if _is_plain_json(self.base_config):
+                base_config_json = json_dumps(self.base_config, separators=(",", ":"))
+
             for i, trial_update in enumerate(self.get_trial_updates()):
-                trial_configuration: dict[str, Any] = deepcopy(self.base_config)
+                trial_configuration: dict[str, Any]
+                if base_config_json is not None:
+                    trial_configuration = json_loads(base_config_json)
+                else:
+                    trial_configuration = deepcopy(self.base_config)
 
                 nested_update(trial_configuration, trial_update)
 
@@ -568,10 +746,20 @@ class Series(Generic[ConfigClass], Experiment):
         if not self.is_singular:
             skip = 0 if include_skipped else self.series_skip
 
+            if skip >= len(self.trials):
+                # nothing to yield (e.g. the series is empty), the
+                # series might not have been started in this case
+                return
+
+            output_dir = self.output_dir
+
+            # number of digits of the trial subdirectory names
+            width = ceil(log10(len(self)))
+
             for i, trial in enumerate(self.trials[skip:], start=skip):
-                trial_subdir = str(i).zfill(ceil(log10(len(self))))
+                trial_subdir = str(i).zfill(width)
 
-                trial.metadata.output_dir = self.output_dir / trial_subdir
+                trial.metadata.output_dir = output_dir / trial_subdir
 
                 yield trial
         else:
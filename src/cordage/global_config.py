@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from os import PathLike
 from pathlib import Path
@@ -10,6 +10,10 @@ from cordage.util import logger
 
 _warned_deprecated_nested_global_config: bool = False
 
+# Global configs loaded from files, keyed by class and path (along with
+# the stat signature of the file when it was loaded)
+_file_cache: dict[tuple[type, Path], tuple[tuple[int, ...], Any]] = {}
+
 
 @dataclass
 class GlobalConfig:
@@ -77,7 +81,7 @@ class GlobalConfig:
                 raise FileNotFoundError(msg)
 
             logger.debug("Loading global config from file (%s).", global_config)
-            return config_from_file(cls, global_config)
+            return cls._from_file(global_config)
 
         # GlobalConfig object
         elif isinstance(global_config, cls):
@@ -93,12 +97,12 @@ class GlobalConfig:
                     "Loading project specific global config (%s).",
                     cls.PROJECT_SPECIFIC_CONFIG_PATH,
                 )
-                return config_from_file(cls, cls.PROJECT_SPECIFIC_CONFIG_PATH)
+                return cls._from_file(cls.PROJECT_SPECIFIC_CONFIG_PATH)
 
             # 2. Check if a global configuration file exists
             elif cls.GLOBAL_CONFIG_PATH.exists():
                 logger.debug("Loading global config (%s).", cls.GLOBAL_CONFIG_PATH)
-                return config_from_file(cls, cls.GLOBAL_CONFIG_PATH)
+                return cls._from_file(cls.GLOBAL_CONFIG_PATH)
 
             # 3. Use the default values
             else:
@@ -113,6 +117,22 @@ class GlobalConfig:
             msg = "`global_config` must be one of str, PathLike, dict, cordage.GlobalConfig, None"
             raise TypeError(msg)
 
+    @classmethod
+    def _from_file(cls, path: Path) -> "GlobalConfig":
+        """Load the configuration from a file.
+
+        The file is only read again if it has been modified. Each call
+        returns a new object, so callers may modify it.
+        """
+        key = (cls, path.resolve())
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+
+        if key not in _file_cache or _file_cache[key][0] != signature:
+            _file_cache[key] = (signature, config_from_file(cls, path))
+
+        return replace(_file_cache[key][1])
+
     @classmethod
     def _convert_old_to_new(cls, d: dict[str, Any]) -> dict[str, Any]:
         global _warned_deprecated_nested_global_config  # noqa: PLW0603
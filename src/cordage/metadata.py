@@ -1,4 +1,3 @@
-import json
 import re
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
@@ -23,8 +22,11 @@ from enum import Enum
 from cordage.global_config import GlobalConfig
 from cordage.util import (
     from_dict,
+    json_dumps,
+    json_loads,
     logger,
     to_dict,
+    write_file_atomic,
 )
 
 if typing.TYPE_CHECKING:
@@ -93,6 +95,16 @@ class Metadata:
         return from_dict(cls, data)
 
 
+def _file_signature(path: Path) -> Optional[tuple]:
+    """Return a signature which changes when the file is modified."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    return (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+
+
 class MetadataStore:
     def __init__(
         self,
@@ -103,6 +115,10 @@ class MetadataStore:
     ):
         self.metadata: Metadata
 
+        # path, hash and file signature of the last metadata written by
+        # `save_metadata`
+        self._last_written_metadata: Optional[tuple[Path, int, Optional[tuple]]] = None
+
         if metadata is not None:
             if global_config is not None or len(kw) > 0:
                 msg = "Using the `metadata` argument is incompatible with using other arguments."
@@ -141,12 +157,27 @@ class MetadataStore:
     def save_metadata(self):
         md_dict = self.metadata.to_dict()
 
-        with open(self.metadata_path, "w", encoding="utf-8") as fp:
+        def invalid_obj_default(obj):
+            logger.warning("Cannot serialize %s", str(obj))
+
+        # encode first and write the result at once (json.dump would
+        # write each chunk separately)
+        payload = json_dumps(md_dict, default=invalid_obj_default)
 
-            def invalid_obj_default(obj):
-                logger.warning("Cannot serialize %s", str(obj))
+        # skip writing if the same content was already written to this
+        # path and the file has not been changed (or removed) since
+        path = self.metadata_path
+        written = (path, hash(payload))
+        if (
+            self._last_written_metadata is not None
+            and written == self._last_written_metadata[:2]
+            and _file_signature(path) == self._last_written_metadata[2]
+        ):
+            return
 
-            json.dump(md_dict, fp, indent=4, default=invalid_obj_default)
+        write_file_atomic(path, payload)
+
+        self._last_written_metadata = (*written, _file_signature(path))
 
     @classmethod
     def load_metadata(cls, path: PathLike) -> Metadata:
@@ -154,9 +185,8 @@ class MetadataStore:
         if not path.suffix == ".json":
             path = path / "cordage.json"
 
-        with path.open("r", encoding="utf-8") as fp:
-            metadata_dict = GlobalConfig._convert_old_to_new(json.load(fp))
-            metadata = Metadata.from_dict(metadata_dict)
+        metadata_dict = GlobalConfig._convert_old_to_new(json_loads(path.read_bytes()))
+        metadata = Metadata.from_dict(metadata_dict)
 
         if metadata.output_dir != path.parent:
             logger.info(
@@ -176,14 +206,30 @@ class Annotatable(MetadataStore):
 
         self.annotations = {}
 
+        # comment and the implicit tags found in it
+        self._implicit_tags_cache: Optional[tuple[str, frozenset[str]]] = None
+
+    @property
+    def implicit_tags(self) -> frozenset[str]:
+        """Tags given in the comment (e.g. `#tag`)."""
+        comment = self.comment
+
+        if self._implicit_tags_cache is None or self._implicit_tags_cache[0] != comment:
+            self._implicit_tags_cache = (comment, frozenset(self.TAG_PATTERN.findall(comment)))
+
+        return self._implicit_tags_cache[1]
+
     @property
     def tags(self):
-        tags = set(self.explicit_tags)
+        return list(self.tag_set)
 
-        # implicit tags
-        tags.update(re.findall(self.TAG_PATTERN, self.comment))
+    @property
+    def tag_set(self) -> set[str]:
+        """All (explicit and implicit) tags as a set."""
+        tags = set(self.explicit_tags)
+        tags.update(self.implicit_tags)
 
-        return list(tags)
+        return tags
 
     @property
     def explicit_tags(self):
@@ -192,12 +238,25 @@ class Annotatable(MetadataStore):
         return self.annotations["tags"]
 
     def add_tag(self, *tags: Iterable):
+        explicit_tags = self.explicit_tags
+        present = set(explicit_tags)
+
         for t in tags:
-            if t not in self.explicit_tags:
-                self.explicit_tags.append(t)
+            if t not in present:
+                explicit_tags.append(t)
+                present.add(t)
 
     def has_tag(self, *tags: str):
-        return len(tags) == 0 or any(t in tags for t in self.tags)
+        if len(tags) == 0:
+            return True
+
+        # check the explicit tags first: the implicit tags require the
+        # comment to be parsed (unless it is cached)
+        explicit_tags = self.explicit_tags
+        if any(t in explicit_tags for t in tags):
+            return True
+
+        return not self.implicit_tags.isdisjoint(tags)
 
     @property
     def comment(self):
@@ -212,10 +271,13 @@ class Annotatable(MetadataStore):
         return self.output_dir / "annotations.json"
 
     def save_annotations(self):
-        with open(self.annotations_path, "w", encoding="utf-8") as fp:
-            json.dump(self.annotations, fp, indent=4)
+        payload = json_dumps(self.annotations)
+
+        write_file_atomic(self.annotations_path, payload)
 
     def load_annotations(self):
-        if self.annotations_path.exists():
-            with self.annotations_path.open("r", encoding="utf-8") as fp:
-                self.annotations = json.load(fp)
+        try:
+            self.annotations = json_loads(self.annotations_path.read_bytes())
+        except FileNotFoundError:
+            # no annotations have been saved (yet)
+            pass
@@ -1,8 +1,12 @@
 import dataclasses
+import json
 import logging
+import os
+import re
 import typing
-from collections.abc import Generator, Iterable, Mapping
+from collections.abc import Generator, Iterable, Mapping, Sequence
 from datetime import datetime, timedelta
+from functools import cache, lru_cache, partial
 from os import PathLike
 from pathlib import Path
 from typing import (
@@ -19,6 +23,11 @@ from typing import (
 import dacite
 import dacite.exceptions
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 if typing.TYPE_CHECKING:
     from _typeshed import DataclassInstance
 
@@ -43,6 +52,68 @@ deserialization_map: dict[type[Any], Callable[..., Any]] = {
 types_to_cast: list[type[Any]] = [Path, float, bool, int, str, tuple]
 
 
+# orjson decodes integers outside of the 64 bit range as floats: any run
+# of 19 or more digits might be such an integer
+_long_digit_run = re.compile(r"\d{19}")
+_long_digit_run_bytes = re.compile(rb"\d{19}")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document (using orjson, if it is installed).
+
+    Documents which might contain integers exceeding 64 bit are decoded
+    with the json module, which keeps their exact value.
+    """
+    if isinstance(data, bytes):
+        may_have_big_ints = _long_digit_run_bytes.search(data) is not None
+    else:
+        may_have_big_ints = _long_digit_run.search(data) is not None
+
+    if orjson is not None and not may_have_big_ints:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (e.g. it
+            # rejects NaN): let the json module decide
+            pass
+
+    return json.loads(data)
+
+
+def json_dumps(data: Any, *, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode a JSON document (indented for readability).
+
+    The json module is used (rather than orjson) so that the written
+    files stay the same, e.g. NaN is kept and float subclasses are
+    encoded as floats.
+    """
+    return json.dumps(data, indent=4, default=default)
+
+
+def write_file_atomic(path: PathLike, text: str):
+    """Write a text file (UTF-8) in a single step.
+
+    The text is written to a temporary file next to the target, which
+    then replaces the target. Readers thus never see a partially written
+    file.
+    """
+    data = memoryview(text.encode("utf-8"))
+    tmp_path = f"{os.fspath(path)}.tmp"
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while len(data) > 0:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+    os.replace(tmp_path, path)
+
+
+def _load_file_contents(loads: Callable[[str], Any], fp) -> Any:
+    return loads(fp.read())
+
+
 def get_loader(extension: str) -> Callable:
     """Load module for reading a file with the given extension."""
     msg = f"Unrecognized file format: '.{extension}' (supported are .toml, .yaml, and .json)."
@@ -53,29 +124,32 @@ def get_loader(extension: str) -> Callable:
 
     if extension == "toml":
         try:
-            from toml import load as toml_loader
+            # TOML parser of the standard library (Python 3.11+)
+            import tomllib
 
-            loader = toml_loader
-        except ModuleNotFoundError as exc:
-            msg = f"Package toml is required to read .{extension} files."
-            raise RuntimeError(msg) from exc
+            loader = partial(_load_file_contents, tomllib.loads)
+        except ModuleNotFoundError:
+            try:
+                from toml import load as toml_loader
+
+                loader = toml_loader
+            except ModuleNotFoundError as exc:
+                msg = f"Package toml is required to read .{extension} files."
+                raise RuntimeError(msg) from exc
 
     elif extension in ("yaml", "yml", "yl"):
         try:
-            from yaml import safe_load as yaml_loader
+            import yaml
+
+            # use the libyaml based loader if pyyaml was built with it
+            yaml_loader_cls = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-            loader = yaml_loader
+            loader = partial(yaml.load, Loader=yaml_loader_cls)
         except ModuleNotFoundError as exc:
             msg = f"Package pyyaml is required to read .{extension} files."
             raise RuntimeError(msg) from exc
     else:
-        try:
-            from json import load as json_loader
-
-            loader = json_loader
-        except ModuleNotFoundError as exc:
-            msg = f"Package json is required to read .{extension} files."
-            raise RuntimeError(msg) from exc
+        loader = partial(_load_file_contents, json_loads)
 
     return loader
 
@@ -164,74 +238,85 @@ def flattened_items(
     prefix: tuple[Any, ...] = (),
 ) -> Generator[Union[tuple[str, Any], tuple[tuple[Any, ...], Any]], None, None]:
     """Iter over all items in a nested dictionary."""
-    for k, v in nested_dict.items():
-        flat_k: tuple = (
-            *prefix,
-            k,
-        )
+    # iterative depth-first walk (preserves the order of the items)
+    stack = [(prefix, iter(nested_dict.items()))]
+
+    while stack:
+        current_prefix, items = stack[-1]
+
+        for k, v in items:
+            flat_k: tuple = (*current_prefix, k)
+
+            if isinstance(v, dict):
+                # descend into sub-dict, continue with this level later
+                stack.append((flat_k, iter(v.items())))
+                break
+
+            elif sep is None:
+                yield flat_k, v
+            else:
+                yield sep.join(flat_k), v
 
-        if isinstance(v, dict):
-            for ik, iv in flattened_items(v, prefix=flat_k):
-                if sep is None:
-                    yield ik, iv
-                else:
-                    yield sep.join(ik), iv
-        elif sep is None:
-            yield flat_k, v
         else:
-            yield sep.join(flat_k), v
+            # all items on this level have been processed
+            stack.pop()
 
 
 def nested_update(target_dict: dict, update_dict: Mapping):
-    """Update a nested dictionary."""
-    for k, v in update_dict.items():
-        if isinstance(v, Mapping) and k in target_dict and isinstance(target_dict[k], dict):
-            nested_update(target_dict[k], v)
-        else:
-            target_dict[k] = v
+    """Update a nested dictionary (in place)."""
+    stack = [(target_dict, update_dict)]
+
+    while stack:
+        target, update = stack.pop()
+
+        for k, v in update.items():
+            if isinstance(v, Mapping) and isinstance(target.get(k), dict):
+                stack.append((target[k], v))
+            else:
+                target[k] = v
 
     return target_dict
 
 
-def nest_items(flat_items: Iterable[tuple[Union[str, tuple[Any, ...]], Any]]) -> dict[str, Any]:
+def nest_items(
+    flat_items: Iterable[tuple[Union[str, tuple[Any, ...]], Any]],
+    into: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
     """Unflatten a dict.
 
-    If any keys contain '.', sub-dicts will be created.
+    If any keys contain '.', sub-dicts will be created. If `into` is
+    given, the items are merged into this (nested) dict instead of a new
+    one.
     """
-    nested_dict: dict[str, Any] = {}
-    dicts_to_nest: list[str] = []
+    nested_dict: dict[str, Any] = {} if into is None else into
 
     for k, v in flat_items:
-        k_tuple: tuple[Any, ...]
-        if isinstance(k, tuple):
-            k_tuple = k
-        else:
-            # if key is of the form "a.b", split into tuple
-            k_tuple = tuple(k.split("."))
-
-        prefix = k_tuple[0]
-        remainder = k_tuple[1:]
+        # if key is of the form "a.b", split into parts
+        parts: Sequence[Any] = k if isinstance(k, tuple) else k.split(".")
 
-        if len(remainder) == 0:
-            nested_dict[prefix] = v
+        target = nested_dict
+        for part in parts[:-1]:
+            sub_dict = target.get(part)
 
-        else:
-            if prefix not in nested_dict:
-                nested_dict[prefix] = {}
-                dicts_to_nest.append(prefix)
+            if not isinstance(sub_dict, dict):
+                sub_dict = target[part] = {}
 
-            nested_dict[prefix][remainder] = v
+            target = sub_dict
 
-    for k in dicts_to_nest:
-        nested_dict[k] = nest_items(nested_dict[k].items())
+        target[parts[-1]] = v
 
     return nested_dict
 
 
+@cache
+def _dacite_config(*, strict: bool) -> dacite.Config:
+    # the dacite configuration only depends on `strict`: reuse it
+    return dacite.Config(cast=types_to_cast, type_hooks=deserialization_map, strict=strict)
+
+
 def from_dict(data_class: type[ConfigClass], data: Mapping, *, strict: bool = True) -> ConfigClass:
-    config = dacite.Config(cast=types_to_cast, type_hooks=deserialization_map, strict=strict)
     try:
-        return dacite.from_dict(data_class, data, config)
+        return dacite.from_dict(data_class, data, _dacite_config(strict=strict))
     except dacite.exceptions.WrongTypeError as e:
         msg = (
             f"Configuration incomplete: {e}.\n"
@@ -276,6 +361,15 @@ def apply_nested_type_mapping(data: Mapping, type_mapping: Mapping[type, Callabl
     return result
 
 
+@lru_cache(maxsize=256)
+def dataclass_fields(config_cls: type) -> tuple[dataclasses.Field, ...]:
+    """Return the fields of a dataclass.
+
+    Same as `dataclasses.fields`, but the result is cached per class.
+    """
+    return dataclasses.fields(config_cls)
+
+
 def get_nested_field(dataclass_instance, field_name: str) -> Any:
     assert dataclasses.is_dataclass(dataclass_instance)
 
@@ -314,10 +408,11 @@ def to_file(dataclass_instance, path: PathLike):
     return write_dict_to_file(path, to_dict(dataclass_instance))
 
 
+@lru_cache(maxsize=256)
 def config_output_dir_type(
     config_cls: type["DataclassInstance"], param_name_output_dir: str
 ) -> Union[type[str], type[Path], None]:
-    for field in dataclasses.fields(config_cls):
+    for field in dataclass_fields(config_cls):
         if field.name == param_name_output_dir:
             if field.type in (str, "str"):
                 return str
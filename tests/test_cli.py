@@ -85,3 +85,23 @@ def test_explicit_description(capfd, global_config):
     out, _ = capfd.readouterr()
 
     assert "EXPLICIT_DESCRIPTION" in out
+
+
+def test_parser_cache(global_config):
+    def func(config: SimpleConfig):
+        pass
+
+    context_a = cordage.FunctionContext(func, global_config=global_config)
+    context_b = cordage.FunctionContext(func, global_config=global_config)
+
+    assert context_a.argument_parser is context_b.argument_parser
+
+    context_c = cordage.FunctionContext(func, global_config=global_config, description="other")
+
+    assert context_a.argument_parser is not context_c.argument_parser
+
+    cordage.FunctionContext.clear_parser_cache()
+
+    context_d = cordage.FunctionContext(func, global_config=global_config)
+
+    assert context_a.argument_parser is not context_d.argument_parser
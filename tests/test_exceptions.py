@@ -56,6 +56,16 @@ def test_function_without_config_parameter():
     assert "Callable must accept config" in str(e_info.value)
 
 
+def test_function_with_positional_only_parameter(global_config):
+    def func(config: Config, /):
+        pass
+
+    with pytest.raises(TypeError) as e_info:
+        cordage.run(func, args=[], global_config=global_config)
+
+    assert "positional only parameters" in str(e_info.value)
+
+
 def test_function_invalid_object_to_execute(global_config):
     def func(config: Config):
         pass
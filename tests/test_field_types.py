@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Union
+from typing import Annotated, Literal, Optional, Union
 
 import pytest
 from config_classes import LongConfig as Config
@@ -47,6 +47,46 @@ def test_literal_fields(global_config, resources_path):
         cordage.run(func, args=[str(config_file)], global_config=global_config)
 
 
+@pytest.mark.parametrize("args", [[], ["--a", "1"]])
+def test_mixed_literal_field(global_config, args):
+    @dataclass
+    class MixedLiteralConfig:
+        a: Literal[1, "b"] = 1
+
+    def func(config: MixedLiteralConfig):
+        pass
+
+    with pytest.raises(TypeError):
+        cordage.run(func, args=args, global_config=global_config)
+
+
+@pytest.mark.parametrize("args", [[], ["--a", "1"]])
+def test_multi_type_union_field(global_config, args):
+    @dataclass
+    class UnionConfig:
+        a: Union[int, str] = 1
+
+    def func(config: UnionConfig):
+        pass
+
+    with pytest.raises(TypeError):
+        cordage.run(func, args=args, global_config=global_config)
+
+
+def test_unhashable_annotation(global_config):
+    @dataclass
+    class AnnotatedConfig:
+        a: Annotated[int, {"unit": "s"}] = 1
+        b: int = 2
+
+    def func(config: AnnotatedConfig):
+        return config.b
+
+    trial = cordage.run(func, args=["--b", "3"], global_config=global_config)
+
+    assert trial.result == 3
+
+
 def test_tuple_length_fields(global_config, resources_path):
     def func(config: Config):
         pass
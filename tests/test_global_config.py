@@ -1,5 +1,6 @@
 import dataclasses
 import json
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
@@ -28,3 +29,19 @@ def test_format_string_validation(global_config):
 
     with pytest.raises(ValueError):
         _ = dataclasses.replace(global_config, output_dir_format="{function:%Y}")
+
+
+def test_global_config_file_reload(tmp_path):
+    path = tmp_path / "cordage.json"
+    path.write_text(json.dumps({"base_output_dir": "first"}))
+
+    config_a = GlobalConfig.resolve(path)
+    config_b = GlobalConfig.resolve(path)
+
+    assert config_a == config_b
+    assert config_a is not config_b
+
+    # rewritten within the timestamp resolution, but with another size
+    path.write_text(json.dumps({"base_output_dir": "second_dir"}))
+
+    assert GlobalConfig.resolve(path).base_output_dir == Path("second_dir")
@@ -120,3 +120,19 @@ def test_trial_series_loading_with_config_class(global_config, resources_path):
     for i, trial in enumerate(series):
         assert isinstance(trial.config, NestedConfig)
         assert trial.config.alpha.b == f"b{i+1}"
+
+
+def test_symlinked_experiment_loading(global_config, tmp_path):
+    def func(config: SimpleConfig):
+        pass
+
+    trial = cordage.run(func, args=[], global_config=global_config)
+
+    results_path = tmp_path / "linked_results"
+    results_path.mkdir()
+    (results_path / "linked").symlink_to(trial.output_dir, target_is_directory=True)
+
+    experiments = Experiment.all_from_path(results_path)
+
+    assert len(experiments) == 1
+    assert experiments[0].output_dir == results_path / "linked"
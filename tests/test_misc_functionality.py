@@ -107,3 +107,21 @@ def test_config_only_func_params(global_config):
     with pytest.raises(TypeError):
         # function should not need an output_dir
         cordage.run(func, args=[], global_config=global_config, config_only=True)
+
+
+def test_metadata_rewritten_after_external_change(global_config):
+    def func(config: SimpleConfig, cordage_trial: cordage.Trial):
+        pass
+
+    trial = cordage.run(func, args=[], global_config=global_config)
+    content = trial.metadata_path.read_text()
+
+    # a removed file is written again, even if the metadata is the same
+    trial.metadata_path.unlink()
+    trial.save_metadata()
+    assert trial.metadata_path.read_text() == content
+
+    # same for a file that was changed by someone else
+    trial.metadata_path.write_text("{}")
+    trial.save_metadata()
+    assert trial.metadata_path.read_text() == content
@@ -127,3 +127,27 @@ def test_manual_output_dir(global_config):
         ],
         global_config=global_config,
     )
+
+
+@pytest.mark.parametrize(
+    ("output_dir_format", "expected_names"),
+    [
+        ("exp{collision_suffix}", ["exp", "exp_02", "exp_03"]),
+        ("exp{collision_suffix!r}", ["exp''", "exp'_02'", "exp'_03'"]),
+        ("exp{collision_suffix:x>4}", ["expxxxx", "expx_02", "expx_03"]),
+    ],
+)
+def test_output_dir_collision_suffix(global_config, output_dir_format, expected_names):
+    global_config.output_dir_format = output_dir_format
+
+    def func(config: ConfigWithoutOutputDir, output_dir: Path):
+        pass
+
+    names = [
+        cordage.run(
+            func, args=["--a", "1", "--b", "test"], global_config=global_config
+        ).output_dir.name
+        for _ in expected_names
+    ]
+
+    assert names == expected_names
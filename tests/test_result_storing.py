@@ -1,3 +1,4 @@
+import math
 import re
 from pathlib import Path
 
@@ -76,6 +77,46 @@ def test_float_return_value(global_config):
     assert metadata.result == 0.0
 
 
+def test_big_int_return_value(global_config):
+    value = 10**26 + 1
+
+    def func(config: Config, cordage_trial):  # noqa: ARG001
+        return value
+
+    trial = cordage.run(func, args=[], global_config=global_config)
+
+    trial.annotations["seed"] = value
+    trial.save_annotations()
+
+    experiment = Experiment.from_path(trial.output_dir / "cordage.json")
+
+    assert type(experiment.metadata.result) is int
+    assert experiment.metadata.result == value
+    assert experiment.annotations["seed"] == value
+
+
+class FloatSubclass(float):
+    pass
+
+
+def test_non_finite_and_float_subclass_return_value(global_config):
+    def func(config: Config, cordage_trial):  # noqa: ARG001
+        return {"nan": float("nan"), "inf": float("inf"), "sub": FloatSubclass(1.5)}
+
+    trial = cordage.run(func, args=[], global_config=global_config)
+
+    metadata_path = trial.output_dir / "cordage.json"
+
+    assert '\n    "result": {\n        "nan": NaN,' in metadata_path.read_text()
+
+    experiment = Experiment.from_path(metadata_path)
+    metadata = experiment.metadata
+
+    assert math.isnan(metadata.result["nan"])
+    assert metadata.result["inf"] == float("inf")
+    assert metadata.result["sub"] == 1.5
+
+
 def test_unserializable_return_value(global_config, capsys):
     class SomeObject:
         pass
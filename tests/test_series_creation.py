@@ -1,3 +1,6 @@
+from enum import Enum
+from typing import Any
+
 import pytest
 from config_classes import NestedConfig as Config
 
@@ -77,6 +80,48 @@ def test_invalid_trial_series(global_config, resources_path):
         cordage.run(func, args=[str(config_file)], global_config=global_config)
 
 
+def test_invalid_series_spec_values(global_config):
+    # every value of a dict spec needs to be a list (not only the first)
+    series_spec: dict[str, Any] = {"alpha": {"a": [1, 2], "b": "b1"}}
+
+    with pytest.raises(AssertionError):
+        Series(
+            base_config={},
+            series_spec=series_spec,
+            global_config=global_config,
+            function="func",
+        )
+
+
+def test_empty_series(global_config, tmp_path):
+    trial_store: list[cordage.Trial] = []
+
+    def func(config: Config, cordage_trial: cordage.Trial, trial_store=trial_store):  # noqa: ARG001
+        trial_store.append(cordage_trial)
+
+    config_file = tmp_path / "series_empty.json"
+    config_file.write_text('{"__series__": {"alpha": {"a": []}}}')
+
+    series = cordage.run(func, args=[str(config_file)], global_config=global_config)
+
+    assert isinstance(series, Series)
+    assert len(series) == 0
+    assert trial_store == []
+
+
+def test_all_trials_skipped_without_start(global_config):
+    series: Series = Series(
+        base_config={},
+        series_spec=[{"x": 1}, {"x": 2}],
+        series_skip=2,
+        global_config=global_config,
+        function="func",
+    )
+    series.make_all_trials()
+
+    assert list(series) == []
+
+
 def test_trial_skipping(global_config, resources_path):
     trial_store: list[cordage.Trial] = []
 
@@ -101,3 +146,50 @@ def test_trial_skipping(global_config, resources_path):
 
     for i, trial in enumerate(trial_store, start=1):
         assert trial.output_dir == global_config.base_output_dir / "experiment" / str(i)
+
+
+def test_series_list_entry_nesting(global_config):
+    series_spec: list[dict[str, Any]] = [
+        {"alpha": {"a": 1}, "beta": {}},
+        {"alpha.a": 2, "beta": {}},
+    ]
+
+    series: Series = Series(
+        base_config={}, series_spec=series_spec, global_config=global_config, function="func"
+    )
+
+    # dotted keys are nested, empty sub-dicts are dropped in all entries
+    assert series.series_spec == [{"alpha": {"a": 1}}, {"alpha": {"a": 2}}]
+
+
+class Letter(str, Enum):
+    A = "a"
+
+
+class FloatSubclass(float):
+    pass
+
+
+@pytest.mark.parametrize(
+    "base_config",
+    [
+        {"letter": Letter.A, "value": FloatSubclass(0.5)},
+        {"seed": 10**26 + 1, "value": 0.5},
+    ],
+)
+def test_series_base_config_types_are_kept(global_config, base_config):
+    series: Series = Series(
+        base_config=base_config,
+        series_spec=[{"x": 1}, {"x": 2}],
+        global_config=global_config,
+        function="func",
+    )
+    series.make_all_trials()
+
+    assert series.trials is not None
+    for trial in series.trials:
+        configuration = trial.metadata.configuration
+
+        for key, value in base_config.items():
+            assert type(configuration[key]) is type(value)
+            assert configuration[key] == value
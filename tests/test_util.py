@@ -1,12 +1,23 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Union
 
 import pytest
 from config_classes import NestedConfig
 from config_classes import SimpleConfig as Config
 
 import cordage
-from cordage.util import from_file, get_nested_field, set_nested_field, to_file
+from cordage.util import (
+    flattened_items,
+    from_file,
+    get_nested_field,
+    json_dumps,
+    json_loads,
+    nest_items,
+    nested_update,
+    set_nested_field,
+    to_file,
+)
 
 
 @pytest.mark.parametrize("extension", ["toml", "yaml", "yml", "yl", "json"])
@@ -35,6 +46,22 @@ def test_unkown_extensions(tmp_path):
         from_file(Config, path)
 
 
+@pytest.mark.parametrize("value", [10**26 + 1, -(2**63) - 1])
+def test_big_int_reading(tmp_path, value):
+    @dataclass
+    class SeedConfig:
+        seed: int
+
+    path = tmp_path / "data.json"
+    path.write_text(f'{{"seed": {value}}}')
+
+    config = from_file(SeedConfig, path)
+
+    assert type(config.seed) is int
+    assert config.seed == value
+    assert json_loads(f"[{value}]".encode()) == [value]
+
+
 def test_value_casting(tmp_path):
     @dataclass
     class ComplexConfig:
@@ -62,3 +89,60 @@ def test_nested_value_retrieval(global_config):
         assert get_nested_field(config, "alpha.a") == 123
 
     cordage.run(func, ["--alpha.a", "42", "--beta.a", "c_value"], global_config=global_config)
+
+
+def test_flattened_items():
+    nested = {"a": 1, "b": {"c": 2, "d": {"e": 3}, "f": 4}, "g": {}, "h": 5}
+
+    assert list(flattened_items(nested)) == [
+        (("a",), 1),
+        (("b", "c"), 2),
+        (("b", "d", "e"), 3),
+        (("b", "f"), 4),
+        (("h",), 5),
+    ]
+
+    assert dict(flattened_items(nested, sep=".")) == {
+        "a": 1,
+        "b.c": 2,
+        "b.d.e": 3,
+        "b.f": 4,
+        "h": 5,
+    }
+
+
+def test_nested_update():
+    target = {"a": 1, "b": {"c": 2, "d": {"e": 3}}, "f": 4}
+
+    result = nested_update(target, {"b": {"d": {"e": 30, "x": 1}}, "f": {"g": 5}})
+
+    assert result is target
+    assert target == {"a": 1, "b": {"c": 2, "d": {"e": 30, "x": 1}}, "f": {"g": 5}}
+
+
+def test_nest_items():
+    flat: dict[Union[str, tuple], int] = {"a": 1, "b.c": 2, "b.d.e": 3, ("b", "f"): 4}
+
+    assert nest_items(flat.items()) == {"a": 1, "b": {"c": 2, "d": {"e": 3}, "f": 4}}
+
+    target = {"a": {"x": 0}, "b": {"c": 1, "g": 5}}
+    result = nest_items(flat.items(), into=target)
+
+    assert result is target
+    assert target == {"a": 1, "b": {"c": 2, "d": {"e": 3}, "f": 4, "g": 5}}
+
+
+def test_json_dumps():
+    # 10**26 + 1 cannot be represented exactly as a float
+    data = {"a": 1, "b": {"c": [1.5, "x", None]}, 3: True, "big": 10**26 + 1}
+
+    loaded = json_loads(json_dumps(data))
+
+    assert loaded == {
+        "a": 1,
+        "b": {"c": [1.5, "x", None]},
+        "3": True,
+        "big": 10**26 + 1,
+    }
+    assert type(loaded["big"]) is int
+    assert json_dumps(data).startswith('{\n    "a": 1,')